@@ -14,14 +14,287 @@ Usage:
     python manage.py compile_translations
     python manage.py compile_translations --locale zh
     python manage.py compile_translations --verbose
+    python manage.py compile_translations --force
+    python manage.py compile_translations --use-gettext
+
+.mo files are written in-process with Babel when it is installed; msgfmt is
+used otherwise, or when --use-gettext is passed. Merging always uses msgcat.
 """
 
+import contextlib
+import io
+import os
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from pathlib import Path
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+try:
+    from babel.messages.mofile import write_mo
+    from babel.messages.pofile import read_po
+except ImportError:  # Babel is optional; fall back to msgfmt
+    read_po = write_mo = None
+
+# Source files in priority order (first = highest priority)
+SOURCE_FILES = (
+    "manual.po",  # Highest priority
+    "app.po",  # Custom project strings
+    "allauth.po",  # Allauth translations
+    "django-core.po",  # Django core (lowest priority)
+)
+
+# Read size used when streaming msgcat output into msgfmt
+CHUNK_SIZE = 64 * 1024
+
+GETTEXT_NOT_FOUND = (
+    "msgcat command not found. Please install gettext utilities:\n"
+    "  macOS: brew install gettext\n"
+    "  Ubuntu/Debian: apt-get install gettext\n"
+    "  Windows: https://mlocati.github.io/articles/gettext-iconv-windows.html"
+)
+
+
+def _is_up_to_date(targets, sources):
+    """Return True if every target exists and is at least as new as every source."""
+    try:
+        oldest_target = min(target.stat().st_mtime for target in targets)
+    except FileNotFoundError:
+        return False
+
+    return oldest_target >= max(source.stat().st_mtime for source in sources)
+
+
+def _run_parallel(func, jobs):
+    """Run func(*args) for each job in a process pool, yielding results as they finish."""
+    if not jobs:
+        return
+
+    max_workers = min(os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args) for args in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _merge_command(lang_dir, source_names):
+    """Build the msgcat command merging source_names, writing to stdout."""
+    # Merge using msgcat (--use-first gives priority to first file)
+    return [
+        "msgcat",
+        "--use-first",  # First occurrence wins
+        "--sort-output",  # Alphabetical order
+    ] + [str(lang_dir / name) for name in source_names]
+
+
+def _replace_outputs(temp_files):
+    """Move each finished "<name>.tmp" file over <name>."""
+    for temp_file in temp_files:
+        temp_file.replace(temp_file.with_suffix(""))
+
+
+def _discard(temp_files):
+    """Remove temporary outputs left behind by a failed compile."""
+    for temp_file in temp_files:
+        with contextlib.suppress(OSError):
+            temp_file.unlink(missing_ok=True)
+
+
+def _write_mo(po_fileobj, mo_file, strict=False):
+    """Compile the .po catalog read from po_fileobj into mo_file using Babel.
+
+    With strict, any parse problem raises PoFileError, as msgfmt would fail on
+    it. Otherwise read_po() prints parse warnings to stdout; they are captured
+    and returned instead, so they are reported like msgfmt's output rather
+    than leaking from worker processes.
+    """
+    warnings = io.StringIO()
+    with contextlib.redirect_stdout(warnings):
+        catalog = read_po(po_fileobj, abort_invalid=strict)
+    with mo_file.open("wb") as f:
+        write_mo(f, catalog)
+    return warnings.getvalue()
+
+
+def _compile_one_locale(lang_code, lang_dir_str, source_names, use_gettext):
+    """Merge the source .po files of one locale into django.po and compile django.mo.
+
+    Runs in a worker process, so nothing is written to the command's stdout here.
+    Returns a (lang_code, ok, stdout, stderr) tuple for the parent to report;
+    file system errors are reported the same way instead of being raised, so
+    they cannot cut short the collection of the other locales' results.
+    """
+    lang_dir = Path(lang_dir_str)
+    try:
+        if use_gettext:
+            return _merge_and_msgfmt(lang_code, lang_dir, source_names)
+        return _merge_and_babel(lang_code, lang_dir, source_names)
+    except OSError as e:
+        _discard([lang_dir / "django.po.tmp", lang_dir / "django.mo.tmp"])
+        return lang_code, False, "", f"Failed to write translations for {lang_code}: {e}"
+
+
+def _merge_and_babel(lang_code, lang_dir, source_names):
+    """Merge one locale with msgcat and compile it in-process with Babel."""
+    # Outputs are written under temporary names and only moved into place once
+    # both are complete, so a failure never leaves a truncated catalog behind.
+    po_tmp = lang_dir / "django.po.tmp"
+    mo_tmp = lang_dir / "django.mo.tmp"
+
+    try:
+        result = subprocess.run(
+            _merge_command(lang_dir, source_names), check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace")
+        return lang_code, False, "", f"Failed to merge .po files for {lang_code}: {stderr}"
+    except FileNotFoundError:
+        return lang_code, False, "", GETTEXT_NOT_FOUND
+
+    try:
+        # msgcat has already rejected malformed sources, so only Babel's own
+        # stricter checks (plural counts, obsolete entries) can warn here.
+        output = _write_mo(io.BytesIO(result.stdout), mo_tmp)
+        po_tmp.write_bytes(result.stdout)
+    except Exception as e:
+        _discard([mo_tmp, po_tmp])
+        return lang_code, False, "", f"Failed to compile .mo file for {lang_code}: {e}"
+
+    _replace_outputs([mo_tmp, po_tmp])
+    return lang_code, True, output, ""
+
+
+def _merge_and_msgfmt(lang_code, lang_dir, source_names):
+    """Merge one locale with msgcat and compile it with msgfmt.
+
+    msgcat's output is streamed straight into msgfmt's stdin, so both tools run
+    concurrently and msgfmt never re-reads the merged catalog from disk. The
+    merged django.po is still written alongside as it is teed through. Both
+    outputs replace the previous ones only if msgcat and msgfmt succeed.
+    """
+    po_tmp = lang_dir / "django.po.tmp"
+    mo_tmp = lang_dir / "django.mo.tmp"
+
+    cmd = _merge_command(lang_dir, source_names)
+
+    # Compile to .mo using msgfmt, reading the merged catalog from stdin
+    compile_cmd = ["msgfmt", "-o", str(mo_tmp), "-"]
+
+    # Diagnostics go to temporary files rather than pipes so that neither tool
+    # can block on a full stderr pipe while the other is waiting on it.
+    with tempfile.TemporaryFile() as merge_log, tempfile.TemporaryFile() as compile_log:
+        try:
+            merge = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=merge_log)
+        except FileNotFoundError:
+            return lang_code, False, "", GETTEXT_NOT_FOUND
+
+        try:
+            compile_proc = subprocess.Popen(
+                compile_cmd, stdin=subprocess.PIPE, stdout=compile_log, stderr=compile_log
+            )
+        except FileNotFoundError:
+            merge.kill()
+            merge.wait()
+            return lang_code, False, "", GETTEXT_NOT_FOUND
+
+        try:
+            with merge.stdout, po_tmp.open("wb") as po_file:
+                for chunk in iter(lambda: merge.stdout.read(CHUNK_SIZE), b""):
+                    po_file.write(chunk)
+                    # If msgfmt exited early, its return code reports why.
+                    with contextlib.suppress(BrokenPipeError):
+                        compile_proc.stdin.write(chunk)
+        except OSError:
+            # django.po.tmp could not be written; stop both tools before reporting
+            for proc in (merge, compile_proc):
+                proc.kill()
+                proc.wait()
+            raise
+
+        # A failed merge must not reach msgfmt as a complete (empty) catalog
+        if merge.wait():
+            compile_proc.kill()
+            with contextlib.suppress(BrokenPipeError):
+                compile_proc.stdin.close()
+            compile_proc.wait()
+            _discard([po_tmp, mo_tmp])
+            merge_log.seek(0)
+            stderr = merge_log.read().decode(errors="replace")
+            return lang_code, False, "", f"Failed to merge .po files for {lang_code}: {stderr}"
+
+        with contextlib.suppress(BrokenPipeError):
+            compile_proc.stdin.close()
+        compile_proc.wait()
+
+        compile_log.seek(0)
+        output = compile_log.read().decode(errors="replace")
+
+    if compile_proc.returncode:
+        _discard([po_tmp, mo_tmp])
+        return lang_code, False, "", f"Failed to compile .mo file for {lang_code}: {output}"
+
+    _replace_outputs([mo_tmp, po_tmp])
+    return lang_code, True, output, ""
+
+
+def _compile_js_locales(jobs, use_gettext):
+    """Compile djangojs.po to djangojs.mo for each (lang_code, lang_dir) in jobs.
+
+    JS catalogs are small, so Babel compiles them in-process without a pool.
+    With msgfmt, every process is launched before any is waited on, letting
+    the OS run them concurrently. Yields (lang_code, ok, stdout, stderr).
+
+    As with django.mo, djangojs.mo is only replaced by a successful compile,
+    so a failure never leaves an output that looks up to date.
+    """
+    if not use_gettext:
+        for lang_code, lang_dir in jobs:
+            mo_tmp = lang_dir / "djangojs.mo.tmp"
+            try:
+                with (lang_dir / "djangojs.po").open("rb") as po_file:
+                    # Babel is the only parser of djangojs.po, so it must be strict
+                    output = _write_mo(po_file, mo_tmp, strict=True)
+            except Exception as e:
+                _discard([mo_tmp])
+                yield lang_code, False, "", str(e)
+                continue
+            _replace_outputs([mo_tmp])
+            yield lang_code, True, output, ""
+        return
+
+    procs = []
+    for lang_code, lang_dir in jobs:
+        compile_cmd = [
+            "msgfmt",
+            "-o",
+            str(lang_dir / "djangojs.mo.tmp"),
+            str(lang_dir / "djangojs.po"),
+        ]
+        try:
+            proc = subprocess.Popen(
+                compile_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+        except FileNotFoundError:
+            proc = None
+        procs.append((lang_code, lang_dir, proc))
+
+    for lang_code, lang_dir, proc in procs:
+        if proc is None:
+            yield lang_code, False, "", GETTEXT_NOT_FOUND
+            continue
+
+        mo_tmp = lang_dir / "djangojs.mo.tmp"
+        stdout, stderr = proc.communicate()
+        if proc.returncode:
+            _discard([mo_tmp])
+            yield lang_code, False, stdout, stderr
+            continue
+        _replace_outputs([mo_tmp])
+        yield lang_code, True, stdout, ""
+
 
 class Command(BaseCommand):
     """Compile translations by merging multiple .po files."""
@@ -42,12 +315,24 @@ class Command(BaseCommand):
             action="store_true",
             help="Show detailed list of files being merged",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompile even if the .mo files are newer than their sources",
+        )
+        parser.add_argument(
+            "--use-gettext",
+            action="store_true",
+            help="Compile .mo files with msgfmt instead of Babel",
+        )
 
     def handle(self, *args, **options):
         """Execute the command."""
         verbosity = options.get("verbosity", 1)
         show_files = options.get("show_files", False)
         locales = options.get("locales", None)
+        force = options.get("force", False)
+        use_gettext = options.get("use_gettext", False) or read_po is None
 
         # Get the base locale directory
         locale_dir = Path(settings.BASE_DIR) / "base" / "locale"
@@ -60,38 +345,41 @@ class Command(BaseCommand):
             locale_codes = locales
         else:
             # Process all locale directories
-            locale_codes = [
-                d.name
-                for d in locale_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".")
-            ]
+            with os.scandir(locale_dir) as entries:
+                locale_codes = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
 
         if not locale_codes:
             self.stdout.write(self.style.WARNING("No locales found to process"))
             return
 
         total_compiled = 0
+        total_up_to_date = 0
+        jobs = []
+        # File names found in each locale's LC_MESSAGES, shared with the JS step
+        present_files = {}
 
         for lang_code in locale_codes:
             lang_dir = locale_dir / lang_code / "LC_MESSAGES"
 
-            if not lang_dir.exists():
+            # One directory scan per locale instead of a stat() per candidate file
+            try:
+                with os.scandir(lang_dir) as entries:
+                    present = {entry.name for entry in entries if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
                 if show_files or verbosity > 1:
                     self.stdout.write(
                         self.style.WARNING(f"Skipping {lang_code}: No LC_MESSAGES directory")
                     )
                 continue
 
-            # Define source files in priority order (first = highest priority)
-            source_files = [
-                lang_dir / "manual.po",  # Highest priority
-                lang_dir / "app.po",  # Custom project strings
-                lang_dir / "allauth.po",  # Allauth translations
-                lang_dir / "django-core.po",  # Django core (lowest priority)
-            ]
+            present_files[lang_code] = present
 
             # Filter to existing files
-            existing_files = [f for f in source_files if f.exists()]
+            existing_files = [lang_dir / name for name in SOURCE_FILES if name in present]
 
             if not existing_files:
                 if show_files or verbosity > 1:
@@ -102,135 +390,97 @@ class Command(BaseCommand):
                     )
                 continue
 
-            # Output file
-            output_file = lang_dir / "django.po"
-
-            # Merge using msgcat (--use-first gives priority to first file)
-            try:
-                if show_files or verbosity > 1:
-                    self.stdout.write(
-                        f"\nMerging {len(existing_files)} files for {lang_code}:"
-                    )
-                    for f in existing_files:
-                        self.stdout.write(f"  - {f.name}")
-
-                cmd = [
-                    "msgcat",
-                    "--use-first",  # First occurrence wins
-                    "--sort-output",  # Alphabetical order
-                    "-o",
-                    str(output_file),
-                ] + [str(f) for f in existing_files]
-
-                result = subprocess.run(
-                    cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                if show_files and result.stdout:
-                    self.stdout.write(result.stdout)
+            # Skip locales whose outputs are newer than every source file
+            targets = [lang_dir / "django.po", lang_dir / "django.mo"]
+            if not force and _is_up_to_date(targets, existing_files):
+                total_up_to_date += 1
+                self.stdout.write(f"✓ {lang_code}/LC_MESSAGES/django.mo is up to date")
+                continue
 
-            except subprocess.CalledProcessError as e:
-                raise CommandError(
-                    f"Failed to merge .po files for {lang_code}: {e.stderr}"
-                )
-            except FileNotFoundError:
-                raise CommandError(
-                    "msgcat command not found. Please install gettext utilities:\n"
-                    "  macOS: brew install gettext\n"
-                    "  Ubuntu/Debian: apt-get install gettext\n"
-                    "  Windows: https://mlocati.github.io/articles/gettext-iconv-windows.html"
+            if show_files or verbosity > 1:
+                self.stdout.write(
+                    f"\nMerging {len(existing_files)} files for {lang_code}:"
                 )
+                for f in existing_files:
+                    self.stdout.write(f"  - {f.name}")
 
-            # Compile to .mo using msgfmt
-            try:
-                mo_file = lang_dir / "django.mo"
-                compile_cmd = [
-                    "msgfmt",
-                    "-o",
-                    str(mo_file),
-                    str(output_file),
-                ]
+            jobs.append(
+                (lang_code, str(lang_dir), [f.name for f in existing_files], use_gettext)
+            )
 
-                result = subprocess.run(
-                    compile_cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
+        # Merge and compile every locale in parallel; failures are collected so
+        # that one broken locale does not discard the work done for the others.
+        errors = []
+        for lang_code, ok, stdout, stderr in _run_parallel(_compile_one_locale, jobs):
+            if show_files and stdout:
+                self.stdout.write(stdout)
 
-                if show_files and result.stdout:
-                    self.stdout.write(result.stdout)
+            if not ok:
+                errors.append(stderr)
+                continue
 
-                total_compiled += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/django.mo")
-                )
+            total_compiled += 1
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/django.mo")
+            )
 
-            except subprocess.CalledProcessError as e:
-                raise CommandError(
-                    f"Failed to compile .mo file for {lang_code}: {e.stderr}"
-                )
+        if errors:
+            raise CommandError("\n".join(dict.fromkeys(errors)))
 
         # Also compile JavaScript translations if they exist
-        self._compile_js_translations(locale_dir, locales, show_files, verbosity)
+        js_compiled = self._compile_js_translations(
+            locale_dir, present_files, show_files, force, use_gettext
+        )
 
         # Summary
-        if total_compiled > 0:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"\n✓ Successfully compiled {total_compiled} locale(s)"
-                )
-            )
+        if total_compiled > 0 or js_compiled > 0:
+            summary = f"\n✓ Successfully compiled {total_compiled} locale(s)"
+            if js_compiled > 0:
+                summary += f" and {js_compiled} JavaScript catalog(s)"
+            self.stdout.write(self.style.SUCCESS(summary))
+        elif total_up_to_date > 0:
+            self.stdout.write(self.style.SUCCESS("\n✓ All translations are up to date"))
         else:
             self.stdout.write(self.style.WARNING("No translations were compiled"))
 
-    def _compile_js_translations(self, locale_dir, locales, show_files, verbosity):
-        """Compile JavaScript translation files (djangojs.po -> djangojs.mo)."""
-        if locales:
-            locale_codes = locales
-        else:
-            locale_codes = [
-                d.name
-                for d in locale_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".")
-            ]
+    def _compile_js_translations(
+        self, locale_dir, present_files, show_files, force, use_gettext
+    ):
+        """Compile JavaScript translation files (djangojs.po -> djangojs.mo).
+
+        present_files maps each locale code to the file names in its LC_MESSAGES.
+        Returns the number of djangojs.mo files compiled.
+        """
+        compiled = 0
+        jobs = []
+        for lang_code, present in present_files.items():
+            if "djangojs.po" not in present:
+                continue
 
-        for lang_code in locale_codes:
             lang_dir = locale_dir / lang_code / "LC_MESSAGES"
             js_po_file = lang_dir / "djangojs.po"
-            js_mo_file = lang_dir / "djangojs.mo"
 
-            if not js_po_file.exists():
+            if not force and _is_up_to_date([lang_dir / "djangojs.mo"], [js_po_file]):
+                self.stdout.write(f"✓ {lang_code}/LC_MESSAGES/djangojs.mo is up to date")
                 continue
 
-            try:
-                compile_cmd = [
-                    "msgfmt",
-                    "-o",
-                    str(js_mo_file),
-                    str(js_po_file),
-                ]
-
-                result = subprocess.run(
-                    compile_cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                if show_files and result.stdout:
-                    self.stdout.write(result.stdout)
+            jobs.append((lang_code, lang_dir))
 
-                self.stdout.write(
-                    self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/djangojs.mo")
-                )
+        for lang_code, ok, stdout, stderr in _compile_js_locales(jobs, use_gettext):
+            if show_files and stdout:
+                self.stdout.write(stdout)
 
-            except subprocess.CalledProcessError as e:
+            if not ok:
                 self.stdout.write(
                     self.style.WARNING(
-                        f"Failed to compile JS translations for {lang_code}: {e.stderr}"
+                        f"Failed to compile JS translations for {lang_code}: {stderr}"
                     )
                 )
+                continue
+
+            compiled += 1
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/djangojs.mo")
+            )
+
+        return compiled
@@ -0,0 +1,197 @@
+"""Tests for the compile_translations management command."""
+import gettext
+import os
+import shutil
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+requires_gettext = pytest.mark.skipif(
+    shutil.which('msgcat') is None or shutil.which('msgfmt') is None,
+    reason='gettext utilities are not installed',
+)
+
+PO_TEMPLATE = '''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "{msgid}"
+msgstr "{msgstr}"
+'''
+
+
+@pytest.fixture
+def locale_dir(settings, tmp_path: Path) -> Path:
+    """Point BASE_DIR at a scratch tree with two locales."""
+    settings.BASE_DIR = tmp_path
+    locale_dir = tmp_path / 'base' / 'locale'
+    for lang_code in ('en', 'zh'):
+        lang_dir = locale_dir / lang_code / 'LC_MESSAGES'
+        lang_dir.mkdir(parents=True)
+        (lang_dir / 'manual.po').write_text(
+            PO_TEMPLATE.format(msgid='Home', msgstr=f'Home-{lang_code}'), encoding='utf-8'
+        )
+        (lang_dir / 'app.po').write_text(
+            PO_TEMPLATE.format(msgid='Home', msgstr='ignored'), encoding='utf-8'
+        )
+    (locale_dir / 'zh' / 'LC_MESSAGES' / 'djangojs.po').write_text(
+        PO_TEMPLATE.format(msgid='Welcome', msgstr='歡迎'), encoding='utf-8'
+    )
+    return locale_dir
+
+
+def _path_with_failing(tool: str, tmp_path: Path) -> str:
+    """Return a PATH where `tool` is a script that always fails."""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir(exist_ok=True)
+    script = bin_dir / tool
+    script.write_text(f'#!/bin/sh\necho "{tool}: broken" >&2\nexit 1\n')
+    script.chmod(0o755)
+    return f'{bin_dir}{os.pathsep}{os.environ["PATH"]}'
+
+
+def _translate(mo_file: Path, message: str) -> str:
+    """Look up `message` in a compiled catalog."""
+    with mo_file.open('rb') as f:
+        return gettext.GNUTranslations(f).gettext(message)
+
+
+@requires_gettext
+def test_compiles_every_locale(locale_dir: Path):
+    out = StringIO()
+    call_command('compile_translations', stdout=out)
+
+    for lang_code in ('en', 'zh'):
+        lang_dir = locale_dir / lang_code / 'LC_MESSAGES'
+        assert (lang_dir / 'django.po').exists()
+        assert (lang_dir / 'django.mo').exists()
+        assert f'Home-{lang_code}' in (lang_dir / 'django.po').read_text(encoding='utf-8')
+        # manual.po takes priority over app.po in the compiled catalog
+        assert _translate(lang_dir / 'django.mo', 'Home') == f'Home-{lang_code}'
+    assert (locale_dir / 'zh' / 'LC_MESSAGES' / 'djangojs.mo').exists()
+    assert 'Successfully compiled 2 locale(s)' in out.getvalue()
+
+
+def test_missing_gettext_raises_command_error(locale_dir: Path, monkeypatch):
+    monkeypatch.setenv('PATH', '')
+
+    with pytest.raises(CommandError, match='msgcat command not found'):
+        call_command('compile_translations', stdout=StringIO())
+
+
+@requires_gettext
+def test_skips_locales_newer_than_their_sources(locale_dir: Path):
+    call_command('compile_translations', stdout=StringIO())
+
+    out = StringIO()
+    call_command('compile_translations', stdout=out)
+    assert 'en/LC_MESSAGES/django.mo is up to date' in out.getvalue()
+    assert 'zh/LC_MESSAGES/djangojs.mo is up to date' in out.getvalue()
+    assert 'All translations are up to date' in out.getvalue()
+
+    # Only the JS catalog is stale: it is compiled and counted in the summary
+    os.utime(locale_dir / 'zh' / 'LC_MESSAGES' / 'djangojs.mo', (0, 0))
+    out = StringIO()
+    call_command('compile_translations', stdout=out)
+    assert 'Successfully compiled 0 locale(s) and 1 JavaScript catalog(s)' in out.getvalue()
+    assert 'All translations are up to date' not in out.getvalue()
+
+    out = StringIO()
+    call_command('compile_translations', force=True, stdout=out)
+    assert 'Successfully compiled 2 locale(s)' in out.getvalue()
+
+
+@requires_gettext
+def test_use_gettext_compiles_with_msgfmt(locale_dir: Path):
+    out = StringIO()
+    call_command('compile_translations', use_gettext=True, stdout=out)
+
+    assert (locale_dir / 'en' / 'LC_MESSAGES' / 'django.mo').exists()
+    assert (locale_dir / 'zh' / 'LC_MESSAGES' / 'djangojs.mo').exists()
+    assert 'Successfully compiled 2 locale(s)' in out.getvalue()
+
+
+@requires_gettext
+@pytest.mark.parametrize('use_gettext', [False, True])
+def test_failed_merge_keeps_previous_outputs(
+    locale_dir: Path, tmp_path: Path, monkeypatch, use_gettext: bool
+):
+    call_command('compile_translations', stdout=StringIO())
+    lang_dir = locale_dir / 'en' / 'LC_MESSAGES'
+    previous = {name: (lang_dir / name).read_bytes() for name in ('django.po', 'django.mo')}
+
+    with monkeypatch.context() as m:
+        m.setenv('PATH', _path_with_failing('msgcat', tmp_path))
+        with pytest.raises(CommandError, match='Failed to merge .po files for en'):
+            call_command(
+                'compile_translations', force=True, use_gettext=use_gettext, stdout=StringIO()
+            )
+
+    assert {name: (lang_dir / name).read_bytes() for name in previous} == previous
+    assert not list(lang_dir.glob('*.tmp'))
+
+
+@requires_gettext
+@pytest.mark.parametrize('tool', ['msgcat', 'msgfmt'])
+def test_rerun_after_failure_recompiles(
+    locale_dir: Path, tmp_path: Path, monkeypatch, tool: str
+):
+    call_command('compile_translations', stdout=StringIO())
+    # Make the outputs older than their sources, as after editing a .po file
+    for lang_code in ('en', 'zh'):
+        for name in ('django.po', 'django.mo'):
+            os.utime(locale_dir / lang_code / 'LC_MESSAGES' / name, (0, 0))
+
+    with monkeypatch.context() as m:
+        m.setenv('PATH', _path_with_failing(tool, tmp_path))
+        with pytest.raises(CommandError):
+            call_command('compile_translations', use_gettext=True, stdout=StringIO())
+
+    out = StringIO()
+    call_command('compile_translations', stdout=out)
+    assert 'django.mo is up to date' not in out.getvalue()
+    assert 'Successfully compiled 2 locale(s)' in out.getvalue()
+
+
+@requires_gettext
+def test_broken_locale_does_not_stop_the_others(locale_dir: Path):
+    (locale_dir / 'zh' / 'LC_MESSAGES' / 'manual.po').write_text(
+        'this is not a po file {\n', encoding='utf-8'
+    )
+
+    with pytest.raises(CommandError, match='Failed to merge .po files for zh'):
+        call_command('compile_translations', stdout=StringIO())
+
+    en_mo = locale_dir / 'en' / 'LC_MESSAGES' / 'django.mo'
+    assert _translate(en_mo, 'Home') == 'Home-en'
+    assert not (locale_dir / 'zh' / 'LC_MESSAGES' / 'django.mo').exists()
+
+
+@requires_gettext
+@pytest.mark.parametrize('use_gettext', [False, True])
+def test_malformed_js_catalog_fails_to_compile(locale_dir: Path, capsys, use_gettext: bool):
+    js_po = locale_dir / 'zh' / 'LC_MESSAGES' / 'djangojs.po'
+    js_po.write_text(js_po.read_text(encoding='utf-8') + 'stray line\n', encoding='utf-8')
+
+    out = StringIO()
+    call_command('compile_translations', use_gettext=use_gettext, stdout=out)
+
+    # Babel and msgfmt agree: the catalog is rejected rather than compiled
+    assert 'Failed to compile JS translations for zh' in out.getvalue()
+    assert not js_po.with_suffix('.mo').exists()
+    assert not capsys.readouterr().out
+
+
+@requires_gettext
+@pytest.mark.parametrize('use_gettext', [False, True])
+def test_unwritable_locale_is_reported_as_command_error(locale_dir: Path, use_gettext: bool):
+    # A directory where the merged catalog should go makes writing it fail
+    (locale_dir / 'zh' / 'LC_MESSAGES' / 'django.po.tmp').mkdir()
+
+    with pytest.raises(CommandError, match='for zh'):
+        call_command('compile_translations', use_gettext=use_gettext, stdout=StringIO())
+
+    assert _translate(locale_dir / 'en' / 'LC_MESSAGES' / 'django.mo', 'Home') == 'Home-en'
@@ -1,4 +1,5 @@
 """Internationalization configuration and asset tests."""
+import os
 from pathlib import Path
 from typing import Iterable
 
@@ -15,6 +16,16 @@ def base_locale_dir() -> Path:
     return Path(settings.LOCALE_PATHS[0])
 
 
+@pytest.fixture(scope='module')
+def lc_messages_files(base_locale_dir: Path) -> dict[str, set[str]]:
+    """File names in each language's LC_MESSAGES, listed with one scan per language."""
+    files = {}
+    for lang_code, _ in settings.LANGUAGES:
+        with os.scandir(base_locale_dir / lang_code / 'LC_MESSAGES') as entries:
+            files[lang_code] = {entry.name for entry in entries}
+    return files
+
+
 def test_languages_setting_lists_expected_pairs():
     """LANGUAGES should expose English and Traditional Chinese."""
     codes = [code for code, _ in settings.LANGUAGES]
@@ -43,11 +54,10 @@ def test_locale_paths_contain_base_locale_dir():
 
 
 @pytest.mark.parametrize('extension', ['django.po', 'django.mo'])
-def test_translation_files_exist(base_locale_dir: Path, extension: str):
+def test_translation_files_exist(lc_messages_files: dict[str, set[str]], extension: str):
     """Each locale ships both .po and .mo files."""
     for lang_code, _ in settings.LANGUAGES:
-        msg_path = base_locale_dir / lang_code / 'LC_MESSAGES' / extension
-        assert msg_path.exists(), f'Missing {extension} for {lang_code}'
+        assert extension in lc_messages_files[lang_code], f'Missing {extension} for {lang_code}'
 
 
 @pytest.mark.parametrize('string', ['Home', 'Language'])
@@ -62,14 +72,14 @@ def test_language_code_consistency(base_locale_dir: Path):
 
     assert {'en', 'zh'} <= set(language_codes)
 
-    missing_dirs: Iterable[str] = [
-        code for code in language_codes if not (base_locale_dir / code).exists()
-    ]
+    with os.scandir(base_locale_dir) as entries:
+        present_dirs = {entry.name for entry in entries if entry.is_dir()}
+    missing_dirs: Iterable[str] = [code for code in language_codes if code not in present_dirs]
     assert not missing_dirs, f'Missing locale directories: {missing_dirs}'
 
 
 def test_url_pattern_structure():
-    """home and home_zh should always be present."""
+    """A single home pattern serves every language prefix."""
     resolver = get_resolver()
     assert 'home' in resolver.reverse_dict
-    assert 'home_zh' in resolver.reverse_dict
+    assert 'home_zh' not in resolver.reverse_dict
@@ -1,36 +1,34 @@
 """URL-level tests for i18n-aware homepage routes."""
 from django.urls import resolve
-from django.urls import Resolver404
 from django.urls import reverse
 from django.utils.translation import override
 
 
-def _resolved_home_path(path: str, client):
-    try:
+def _resolved_home_path(path: str, language: str) -> str:
+    """Resolve path with language active, as LocaleMiddleware does for a request."""
+    with override(language):
         match = resolve(path)
-    except Resolver404:
-        match = client.get(path).resolver_match
     view_class = getattr(match.func, 'view_class', None)
     return f'{view_class.__module__}.{view_class.__name__}'
 
 
-def test_english_url_resolves(client):
+def test_english_url_resolves():
     """The root path should resolve to the English home view."""
     assert reverse('home') == '/'
-    assert _resolved_home_path('/', client) == 'base.views.HomeView'
+    assert _resolved_home_path('/', 'en') == 'base.views.HomeView'
 
 
-def test_chinese_url_resolves(client):
+def test_chinese_url_resolves():
     """The /zh/ path should resolve to the same view."""
     with override('zh'):
-        assert reverse('home_zh') == '/zh/'
-    assert _resolved_home_path('/zh/', client) == 'base.views.HomeView'
+        assert reverse('home') == '/zh/'
+    assert _resolved_home_path('/zh/', 'zh') == 'base.views.HomeView'
 
 
 def test_url_name_conflicts():
-    """English and Chinese URL names should map to different paths."""
+    """The home URL name should map to a different path per language."""
     with override('en'):
         english_url = reverse('home')
     with override('zh'):
-        chinese_url = reverse('home_zh')
+        chinese_url = reverse('home')
     assert english_url != chinese_url
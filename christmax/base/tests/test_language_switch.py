@@ -1,5 +1,6 @@
 """HTTP and template behaviour for language switching."""
 import pytest
+from django.test import Client
 from django.utils.translation.trans_real import DjangoTranslation
 from django.views.i18n import JavaScriptCatalog
 
@@ -17,6 +18,13 @@ def _javascript_catalog(language: str) -> dict[str, str]:
     return catalog_view.get_catalog()
 
 
+@pytest.fixture(scope='module')
+def rendered() -> dict:
+    """Render each homepage once per module, keyed by URL."""
+    client = Client()
+    return {url: client.get(url) for url in ('/', '/zh/')}
+
+
 # Locale-prefixed routes -----------------------------------------------------
 
 def test_home_uses_english_by_default(client):
@@ -33,8 +41,8 @@ def test_home_zh_route_switches_language(client):
 
 # HTTP responses -------------------------------------------------------------
 
-def test_english_page_content(client):
-    response = client.get('/')
+def test_english_page_content(rendered):
+    response = rendered['/']
     html = _content(response)
 
     assert response.status_code == 200
@@ -43,8 +51,8 @@ def test_english_page_content(client):
     assert '首頁' not in html
 
 
-def test_chinese_page_content(client):
-    response = client.get('/zh/')
+def test_chinese_page_content(rendered):
+    response = rendered['/zh/']
     html = _content(response)
 
     assert response.status_code == 200
@@ -54,22 +62,21 @@ def test_chinese_page_content(client):
 
 
 @pytest.mark.parametrize('url', ['/', '/zh/'])
-def test_language_switcher_presence(client, url: str):
-    response = client.get(url)
-    html = _content(response)
+def test_language_switcher_presence(rendered, url: str):
+    html = _content(rendered[url])
     assert 'language-select' in html
     assert 'switchLanguage' in html
 
 
 # JavaScript helper ----------------------------------------------------------
 
-def test_switch_language_function_exists(client):
-    html = _content(client.get('/'))
+def test_switch_language_function_exists(rendered):
+    html = _content(rendered['/'])
     assert 'function switchLanguage' in html
 
 
-def test_javascript_redirect_logic(client):
-    html = _content(client.get('/'))
+def test_javascript_redirect_logic(rendered):
+    html = _content(rendered['/'])
     assert "window.location.href = '/zh/'" in html
     assert "window.location.href = '/'" in html
 
@@ -87,9 +94,9 @@ def test_complete_language_switching_flow(client):
     assert response.context['LANGUAGE_CODE'] == 'en'
 
 
-def test_navigation_preserves_language(client):
-    assert 'href="/zh/"' in _content(client.get('/zh/'))
-    assert 'href="/"' in _content(client.get('/'))
+def test_navigation_preserves_language(rendered):
+    assert 'href="/zh/"' in _content(rendered['/zh/'])
+    assert 'href="/"' in _content(rendered['/'])
 
 
 def test_javascript_gettext_catalog_for_banner():
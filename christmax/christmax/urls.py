@@ -34,7 +34,6 @@ urlpatterns = [
 urlpatterns += i18n_patterns(
     path('jsi18n/', JavaScriptCatalog.as_view(packages=['base']), name='javascript-catalog'),
     path('', HomeView.as_view(), name='home'),
-    path('', HomeView.as_view(), name='home_zh'),
     path('settings/', SettingsView.as_view(), name='settings'),
     path('accounts/', include('allauth.urls')),
     # require login or redirect to login page
@@ -1,6 +1,7 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
-from django.urls import resolve, Resolver404
+from django.db.models import Q
+from django.urls import reverse
 
 User = get_user_model()
 
@@ -14,26 +15,20 @@ class AdminUsernameBackend(ModelBackend):
         if username is None or password is None:
             return None
 
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            try:
-                user = User.objects.get(email=username)
-            except User.DoesNotExist:
-                return None
-
-        if user.check_password(password):
-            if not user.is_staff:
-                return None
+        # One query for both lookups; a username match wins over an email match
+        candidates = list(User.objects.filter(Q(username=username) | Q(email=username))[:2])
+        if not candidates:
+            return None
+        user = next((c for c in candidates if c.username == username), candidates[0])
 
-            if request and hasattr(request, 'path'):
-                try:
-                    resolved = resolve(request.path)
-                    if resolved.namespace == 'admin':
-                        return user
-                except Resolver404:
-                    pass
+        # Django already resolved the URL before calling the view
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is not None:
+            is_admin_request = resolver_match.namespace == 'admin'
+        else:
+            is_admin_request = getattr(request, 'path', '').startswith(reverse('admin:index'))
 
-            return None
+        if user.check_password(password) and user.is_staff and is_admin_request:
+            return user
 
         return None
@@ -1,31 +1,31 @@
 import re
 import logging
 from allauth.account.adapter import DefaultAccountAdapter
+from allauth.core.exceptions import ImmediateHttpResponse
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
-
-logger = logging.getLogger(__name__)
+from django.contrib import messages
 from django.contrib.auth import get_user_model
+from django.shortcuts import redirect
 
-User = get_user_model()
+logger = logging.getLogger(__name__)
+# Characters not allowed in generated usernames
+_NONWORD_RE = re.compile(r'[^\w]')
 
 
 def generate_username_from_email(user):
     from allauth.account.utils import user_username, user_email
 
+    from .models import find_available_username
+
     username = user_username(user)
 
     if not username:
         email = user_email(user)
         if email:
             local_part = email.split('@')[0]
-            base_username = re.sub(r'[^\w]', '_', local_part)[:150]
-
-            username = base_username
-            counter = 1
-            while User.objects.filter(username=username).exclude(pk=user.pk).exists():
-                username = f'{base_username}_{counter}'
-                counter += 1
+            base_username = _NONWORD_RE.sub('_', local_part)[:150]
 
+            username = find_available_username(base_username, exclude_pk=user.pk)
             user_username(user, username)
 
 
@@ -69,10 +69,6 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
 
         if not email:
             logger.error(f'Social login from {provider} missing email - blocking signup')
-            from django.contrib import messages
-            from allauth.exceptions import ImmediateHttpResponse
-            from django.shortcuts import redirect
-
             messages.error(
                 request,
                 f'Your {provider.title()} account must provide an email address to sign up. '
@@ -81,15 +77,15 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
             raise ImmediateHttpResponse(redirect('/accounts/login/'))
 
         if not sociallogin.is_existing and request.user.is_anonymous:
-            try:
-                user = User.objects.get(email=email)
-
-                sociallogin.connect(request, user)
+            # LIMIT 2 is enough to tell "one match" from "ambiguous" without raising
+            users = list(get_user_model().objects.filter(email=email)[:2])
+            if len(users) == 1:
+                sociallogin.connect(request, users[0])
                 logger.info(f'Linked {provider} account to existing user: {email}')
-            except User.DoesNotExist:
-                logger.info(f'New user signup from {provider}: {email}')
-            except User.MultipleObjectsReturned:
+            elif users:
                 logger.error(f'Multiple users found with email: {email}')
+            else:
+                logger.info(f'New user signup from {provider}: {email}')
         return super().pre_social_login(request, sociallogin)
 
     def populate_user(self, request, sociallogin, data):
@@ -1,9 +1,17 @@
+import re
+
 from django.contrib.auth.models import AbstractUser
+from django.db import IntegrityError
 from django.db import models
+from django.db import transaction
+from django.db.models import Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+# How many times User.save() retries when a generated username is claimed concurrently
+USERNAME_SAVE_ATTEMPTS = 3
+
 
 class User(AbstractUser):
     """
@@ -44,21 +52,59 @@ class User(AbstractUser):
 
     def save(self, *args, **kwargs):
         """Auto-generate username from email if not provided."""
-        if not self.username:
-            # Generate username from email: john.doe@example.com → john_doe
-            local_part = self.email.split('@')[0]
-            base_username = local_part.replace('.', '_').replace('+', '_')[:150]
-
-            # Ensure uniqueness
-            username = base_username
-            counter = 1
-            while User.objects.filter(username=username).exclude(pk=self.pk).exists():
-                username = f'{base_username}_{counter}'
-                counter += 1
-
-            self.username = username
-
-        super().save(*args, **kwargs)
+        if self.username:
+            super().save(*args, **kwargs)
+            return
+
+        # Generate username from email: john.doe@example.com → john_doe
+        local_part = self.email.split('@')[0]
+        base_username = local_part.replace('.', '_').replace('+', '_')[:150]
+
+        for attempt in range(USERNAME_SAVE_ATTEMPTS):
+            self.username = find_available_username(base_username, exclude_pk=self.pk)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+            except IntegrityError:
+                # Retry only if a concurrent signup took the generated username
+                taken = User.objects.filter(username=self.username).exclude(pk=self.pk).exists()
+                if not taken or attempt == USERNAME_SAVE_ATTEMPTS - 1:
+                    self.username = ''
+                    raise
+            else:
+                return
+
+
+def find_available_username(base_username, exclude_pk=None):
+    """Return base_username, or base_username_N with the lowest free N.
+
+    A single query on the unique username index fetches base_username and
+    every name in the "base_username_..." range ("`" sorts right after "_");
+    the numbered variants are then picked out in Python. exclude_pk ignores
+    the user being saved.
+    """
+    # An empty base would otherwise yield a blank username or "_N"
+    base_username = base_username or 'user'
+    suffixed = re.compile(rf'{re.escape(base_username)}_\d+')
+    candidates = (
+        User.objects.filter(
+            Q(username=base_username)
+            | Q(username__gt=f'{base_username}_', username__lt=f'{base_username}`')
+        )
+        .exclude(pk=exclude_pk)
+        .values_list('username', flat=True)
+    )
+    taken = {
+        username
+        for username in candidates
+        if username == base_username or suffixed.fullmatch(username)
+    }
+    username = base_username
+    counter = 1
+    while username in taken:
+        username = f'{base_username}_{counter}'
+        counter += 1
+    return username
 
 
 class Profile(models.Model):
@@ -93,16 +139,19 @@ class Profile(models.Model):
         return f"{self.user.email}'s profile"
 
 
+def create_missing_profiles(users):
+    """Create profiles in one INSERT for users saved without post_save.
+
+    User.objects.bulk_create() does not send post_save, so bulk imports call
+    this afterwards; users that already have a profile are skipped.
+    """
+    # user_id rather than user= so the callers' cached user.profile is left untouched
+    Profile.objects.bulk_create([Profile(user_id=user.pk) for user in users], ignore_conflicts=True)
+
+
 # Signals for auto-creating profiles
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Automatically create Profile when User is created."""
     if created:
         Profile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save profile when user is saved."""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
@@ -1,7 +1,11 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import resolve
 from django.urls import reverse
 
+from users.backends import AdminUsernameBackend
+
 User = get_user_model()
 
 
@@ -53,6 +57,41 @@ def test_admin_login_form_has_username_field(client):
     assert 'name="username"' in content
     assert 'name="email"' not in content or 'type="password"' in content
 
+def test_admin_backend_only_authenticates_admin_requests(test_user):
+    backend = AdminUsernameBackend()
+    credentials = {'username': 'testadmin', 'password': 'testpass123'}
+
+    admin_request = RequestFactory().post('/admin/login/')
+    site_request = RequestFactory().post('/accounts/login/')
+
+    assert backend.authenticate(admin_request, **credentials) == test_user
+    assert backend.authenticate(site_request, **credentials) is None
+
+    # Once the URL is resolved, its namespace decides rather than the path
+    admin_request.resolver_match = resolve('/accounts/login/')
+    site_request.resolver_match = resolve('/admin/login/')
+    assert backend.authenticate(admin_request, **credentials) is None
+    assert backend.authenticate(site_request, **credentials) == test_user
+
+def test_admin_backend_accepts_email_and_prefers_username_match(test_user):
+    backend = AdminUsernameBackend()
+    request = RequestFactory().post('/admin/login/')
+
+    assert backend.authenticate(
+        request, username='testadmin@example.com', password='testpass123'
+    ) == test_user
+
+    # Another staff user whose username equals test_user's email
+    other = User.objects.create_user(
+        username='testadmin@example.com',
+        email='other@example.com',
+        password='otherpass123',
+        is_staff=True,
+    )
+    assert backend.authenticate(
+        request, username='testadmin@example.com', password='otherpass123'
+    ) == other
+
 # Profile Auto-Creation ======================================================
 
 def test_profile_auto_created_on_user_creation(db):
@@ -68,3 +107,38 @@ def test_profile_auto_created_on_user_creation(db):
     assert user.profile is not None
     assert user.profile.player_level == 1
     assert user.profile.experience_points == 0
+
+
+def test_user_save_does_not_rewrite_profile(db):
+    """Updating a user should not issue a write for the untouched profile."""
+    user = User.objects.create_user(
+        username='profiletest', email='profiletest@example.com', password='test123'
+    )
+    updated_at = user.profile.updated_at
+
+    user.first_name = 'Profile'
+    user.save()
+
+    user.profile.refresh_from_db()
+    assert user.profile.updated_at == updated_at
+
+
+def test_create_missing_profiles_for_bulk_created_users(db):
+    """Bulk-created users get profiles in one pass; existing profiles are kept."""
+    from users.models import Profile
+    from users.models import create_missing_profiles
+
+    existing = User.objects.create_user(
+        username='existing', email='existing@example.com', password='test123'
+    )
+    existing.profile.display_name = 'Keep me'
+    existing.profile.save()
+
+    bulk_users = User.objects.bulk_create(
+        [User(username=f'bulk{i}', email=f'bulk{i}@example.com') for i in range(3)]
+    )
+    create_missing_profiles([existing, *bulk_users])
+
+    assert Profile.objects.filter(user__in=bulk_users).count() == 3
+    existing.profile.refresh_from_db()
+    assert existing.profile.display_name == 'Keep me'
@@ -63,3 +63,60 @@ def test_populate_username_then_save_MySocialAccountAdaptor(db):
     user.save()
 
     assert user.username == 'john_doe'
+
+def test_user_save_picks_lowest_free_username_suffix(db):
+    """Generated usernames reuse the first free numeric suffix."""
+    for username in ('john_doe', 'john_doe_1', 'john_doe_3', 'john_doe_x'):
+        User.objects.create_user(
+            username=username, email=f'{username}@example.org', password='test123'
+        )
+
+    user = User(email='john.doe@example.com')
+    user.set_password('test123')
+    user.save()
+
+    assert user.username == 'john_doe_2'
+
+def test_user_save_retries_when_generated_username_is_taken(db, monkeypatch):
+    """A username claimed between lookup and insert triggers a fresh lookup."""
+    User.objects.create_user(username='john_doe', email='first@example.com', password='test123')
+
+    candidates = iter(['john_doe', 'john_doe_1'])
+    monkeypatch.setattr(
+        'users.models.find_available_username', lambda base, exclude_pk=None: next(candidates)
+    )
+
+    user = User(email='john.doe@example.com')
+    user.set_password('test123')
+    user.save()
+
+    assert user.username == 'john_doe_1'
+    assert User.objects.filter(email='john.doe@example.com').exists()
+
+def test_populate_username_is_not_regenerated_on_save(db, django_assert_num_queries):
+    """The adapter picks the username once; User.save() keeps it without another scan."""
+    from users.custom_allauth import MyAccountAdapter
+
+    User.objects.create_user(username='john_doe', email='first@example.com', password='test123')
+
+    user = User(email='John.Doe@example.com')
+    user.set_password('test123')
+    MyAccountAdapter().populate_username(request=None, user=user)
+    assert user.username == 'john_doe_1'
+
+    # Username is already set, so save() must not scan for a free one again
+    with django_assert_num_queries(2):  # INSERT user, INSERT profile
+        user.save()
+    assert user.username == 'john_doe_1'
+
+def test_find_available_username_only_counts_numbered_variants(db):
+    """Names that merely share the prefix, or match it as a regex, are ignored."""
+    from users.models import find_available_username
+
+    for username in ('a.b', 'a.b_1', 'a.b_x', 'a.b_3x', 'a.bc_2', 'axb_2'):
+        User.objects.create_user(
+            username=username, email=f'{username}@example.org', password='test123'
+        )
+
+    assert find_available_username('a.b') == 'a.b_2'
+    assert find_available_username('') == 'user'